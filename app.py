@@ -5,10 +5,13 @@ Features modern UI, robust error handling, and enhanced user experience
 """
 import streamlit as st
 import pandas as pd
-import pickle
-import base64
-from typing import Tuple, Optional, Union
-import time
+import numpy as np
+import scipy.sparse as sp
+import html
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
 
 # Page config
 st.set_page_config(
@@ -19,177 +22,172 @@ st.set_page_config(
 )
 
 # Modern CSS styling
-st.markdown("""
-<style>
-/* Main app styling */
-.main > div {
-    padding-top: 2rem;
-}
+STYLES_FILE = Path(__file__).parent / 'styles.css'
 
-/* Custom header styling */
-.main-header {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    padding: 2rem;
-    border-radius: 15px;
-    margin-bottom: 2rem;
-    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-}
-
-.main-header h1 {
-    color: white;
-    text-align: center;
-    font-size: 3rem;
-    margin: 0;
-    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-}
-
-.main-header p {
-    color: rgba(255,255,255,0.9);
-    text-align: center;
-    font-size: 1.2rem;
-    margin: 0.5rem 0 0 0;
-}
-
-/* Movie card styling */
-.movie-card {
-    background: white;
-    border-radius: 15px;
-    padding: 1rem;
-    margin: 0.5rem;
-    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-    transition: transform 0.3s ease, box-shadow 0.3s ease;
-    border: 1px solid #f0f0f0;
-}
-
-.movie-card:hover {
-    transform: translateY(-5px);
-    box-shadow: 0 15px 35px rgba(0,0,0,0.15);
-}
+@st.cache_resource
+def load_css() -> str:
+    """Read the stylesheet once per process; missing CSS leaves the app unstyled"""
+    try:
+        return STYLES_FILE.read_text(encoding='utf-8')
+    except OSError:
+        return ''
 
-/* Poster styling */
-.poster-container {
-    border-radius: 10px;
-    overflow: hidden;
-    margin-bottom: 1rem;
-    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-}
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
-/* Button styling */
-.stButton > button {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    border: none;
-    border-radius: 25px;
-    padding: 0.75rem 2rem;
-    font-weight: 600;
-    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.3);
-    transition: all 0.3s ease;
-}
+# Caps on titles pushed into the selectbox, with and without a search
+MAX_SEARCH_RESULTS = 500
+DEFAULT_OPTIONS_COUNT = 200
 
-.stButton > button:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-}
+# Data files produced from movie_data.pkl by migrate_data.py
+MOVIES_FILE = 'movies.parquet'
+TFIDF_FILE = 'tfidf.npz'
 
-/* Selectbox styling */
-.stSelectbox > div > div {
-    border-radius: 10px;
-    border: 2px solid #e0e0e0;
-    transition: border-color 0.3s ease;
-}
+# Text columns that may be missing per movie
+OPTIONAL_TEXT_COLUMNS = ('overview', 'genres')
 
-.stSelectbox > div > div:focus-within {
-    border-color: #667eea;
-    box-shadow: 0 0 0 2px rgba(102, 126, 234, 0.2);
-}
+@st.cache_resource
+def load_movies() -> pd.DataFrame:
+    """Load the movie metadata table with Arrow-backed columns
 
-/* Sidebar styling */
-.css-1d391kg {
-    background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
-}
+    Arrow string columns give search and comparisons vectorized C kernels.
+    Cached as a shared resource rather than copied per session, so callers
+    must treat the returned DataFrame as read-only (slice/filter, never mutate).
+    Optional text columns are filled with '' so callers can test truthiness.
+    """
+    movies = pd.read_parquet(MOVIES_FILE, dtype_backend='pyarrow')
+    for column in OPTIONAL_TEXT_COLUMNS:
+        if column in movies.columns:
+            movies[column] = movies[column].fillna('').astype('string[pyarrow]')
+    return movies
 
-/* Success message styling */
-.element-container .stSuccess {
-    background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-    border: none;
-    border-radius: 10px;
-}
+@st.cache_resource
+def load_tfidf_matrix() -> sp.csr_matrix:
+    """Load the L2-normalized TF-IDF vectors (N x vocabulary, sparse)
 
-/* Info message styling */
-.element-container .stInfo {
-    background: linear-gradient(135deg, #d299c2 0%, #fef9d7 100%);
-    border: none;
-    border-radius: 10px;
-}
+    Similarity rows are computed per query from these instead of storing
+    the N x N cosine matrix.
+    """
+    tfidf = sp.load_npz(TFIDF_FILE)
+    # Row slicing and mat-vec products need CSR with float32 values
+    return tfidf.tocsr().astype(np.float32, copy=False)
 
-/* Metrics styling */
-.metric-container {
-    background: white;
-    padding: 1rem;
-    border-radius: 10px;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-    margin: 0.5rem 0;
-}
-</style>
-""", unsafe_allow_html=True)
+def load_movie_data() -> Tuple[Optional[pd.DataFrame], Optional[sp.csr_matrix], bool]:
+    """Load movie data with comprehensive error handling
 
-@st.cache_data
-def load_movie_data() -> Tuple[Optional[pd.DataFrame], Optional[object], bool]:
-    """Load movie data with comprehensive error handling"""
+    Both objects are shared by reference across sessions and must not be mutated.
+    """
     try:
-        with open('movie_data.pkl', 'rb') as f:
-            movies, cosine_sim = pickle.load(f)
+        movies = load_movies()
+        tfidf = load_tfidf_matrix()
         if movies is not None and not movies.empty:
-            return movies, cosine_sim, True
+            return movies, tfidf, True
         else:
             st.error("❌ Movie data is empty or corrupted")
             return None, None, False
     except FileNotFoundError:
-        st.error("❌ Movie data file not found. Please ensure 'movie_data.pkl' exists.")
+        st.error(f"❌ Movie data files not found. Please ensure '{MOVIES_FILE}' and '{TFIDF_FILE}' exist.")
         return None, None, False
     except Exception as e:
         st.error(f"❌ Error loading movie data: {e}")
         return None, None, False
 
+@st.cache_resource
+def build_index(_movies: pd.DataFrame) -> Dict[str, int]:
+    """Map each title to its row position (first occurrence wins)"""
+    title_to_idx: Dict[str, int] = {}
+    for i, title in enumerate(_movies['title'].tolist()):
+        title_to_idx.setdefault(title, i)
+    return title_to_idx
+
+@st.cache_resource
+def build_search_titles(_movies: pd.DataFrame) -> np.ndarray:
+    """Lowercased titles as a fixed-width string array for vectorized search"""
+    return _movies['title'].str.lower().to_numpy(dtype=str)
+
+@st.cache_resource
+def build_prefix_index(_titles_lower: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """Sorted lowercase titles plus the permutation back to row positions"""
+    order = np.argsort(_titles_lower, kind='stable')
+    return _titles_lower[order].tolist(), order
+
+def find_matching_rows(query: str, titles_lower: np.ndarray,
+                       prefix_index: Tuple[List[str], np.ndarray]) -> np.ndarray:
+    """Row positions of titles matching the query
+
+    Prefix matches are found by binary search over the sorted titles; the
+    substring scan runs only when there are none, or when the query starts
+    with '*'.
+    """
+    query = query.lower()
+    if not query.startswith('*'):
+        sorted_titles, order = prefix_index
+        lo = bisect_left(sorted_titles, query)
+        hi = bisect_left(sorted_titles, query + '\U0010ffff', lo)
+        if hi > lo:
+            return order[lo:hi]
+    else:
+        query = query[1:]
+    return np.flatnonzero(np.char.find(titles_lower, query) >= 0)
+
 @st.cache_data
-def get_recommendations(title: str, movies: pd.DataFrame, cosine_sim) -> pd.DataFrame:
-    """Get movie recommendations with enhanced error handling"""
+def dataset_stats(_movies: pd.DataFrame) -> Dict[str, Optional[int]]:
+    """Summary figures for the sidebar, computed once per dataset"""
+    return {
+        'total': len(_movies),
+        'genres': _movies.loc[_movies['genres'] != '', 'genres'].nunique() if 'genres' in _movies.columns else None,
+    }
+
+@st.cache_data
+def get_recommendations(title: str, _movies: pd.DataFrame, _tfidf: sp.csr_matrix,
+                        _title_to_idx: Dict[str, int]) -> pd.DataFrame:
+    """Get movie recommendations with enhanced error handling
+
+    The movies table, TF-IDF matrix and title index are process-wide cached
+    resources, so they are underscore-prefixed and Streamlit does not hash
+    them (a full pass over every row) on every call; only the title is keyed.
+    """
     try:
-        if movies is None or movies.empty:
+        if _movies is None or _movies.empty:
             st.error("❌ No movie data available")
             return pd.DataFrame()
             
         # Find movie index
-        matching_movies = movies[movies['title'] == title]
-        if matching_movies.empty:
+        idx = _title_to_idx.get(title)
+        if idx is None:
             st.error(f"❌ Movie '{title}' not found in database")
             return pd.DataFrame()
-            
-        idx = matching_movies.index[0]
         
-        # Calculate similarity scores
-        sim_scores = list(enumerate(cosine_sim[idx]))
-        sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-        sim_scores = sim_scores[1:11]  # Top 10 excluding the movie itself
+        # Rows are L2-normalized, so one sparse mat-vec gives the cosine row
+        row = (_tfidf @ _tfidf[idx].T).toarray().ravel()
         
-        # Get movie indices
-        movie_indices = [i[0] for i in sim_scores]
+        # Partial top-k selection on the similarity row (O(N) instead of a full sort)
+        k = min(11, len(row))
+        top = np.argpartition(-row, k - 1)[:k]
+        top = top[np.argsort(-row[top])]
+        
+        # Get movie indices, top 10 excluding the movie itself
+        movie_indices = [i for i in top if i != idx][:10]
         
         # Return recommendations with additional columns if available
         columns_to_include = ['title', 'movie_id']
-        if 'overview' in movies.columns:
+        if 'overview' in _movies.columns:
             columns_to_include.append('overview')
-        if 'genres' in movies.columns:
+        if 'genres' in _movies.columns:
             columns_to_include.append('genres')
             
-        return movies[columns_to_include].iloc[movie_indices]
+        return _movies.take(movie_indices).loc[:, columns_to_include]
     
     except Exception as e:
         st.error(f"❌ Error getting recommendations: {e}")
         return pd.DataFrame()
 
-def create_enhanced_poster(movie_id: Union[str, int], title: str) -> str:
-    """Create an enhanced SVG poster with modern design"""
+@lru_cache(maxsize=4096)
+def create_enhanced_poster(movie_id: int, title: str, slot: str) -> str:
+    """Create an enhanced inline SVG poster with modern design (memoized per movie)
+
+    The posters share one DOM, so ``slot`` (e.g. 'about' or 'grid') is part of
+    the gradient/filter ids to keep them unique per placement.
+    """
     gradients = [
         ('#667eea', '#764ba2'),
         ('#f093fb', '#f5576c'),
@@ -201,33 +199,33 @@ def create_enhanced_poster(movie_id: Union[str, int], title: str) -> str:
         ('#ff9a9e', '#fecfef')
     ]
     
-    color1, color2 = gradients[int(movie_id) % len(gradients)]
+    color1, color2 = gradients[movie_id % len(gradients)]
     
     # Truncate title if too long
-    display_title = title[:25] + '...' if len(title) > 25 else title
+    display_title = html.escape(title[:25] + '...' if len(title) > 25 else title)
     
     svg = f'''
-    <svg width="200" height="300" xmlns="http://www.w3.org/2000/svg">
+    <svg width="200" height="300" viewBox="0 0 200 300" xmlns="http://www.w3.org/2000/svg">
         <defs>
-            <linearGradient id="grad{movie_id}" x1="0%" y1="0%" x2="100%" y2="100%">
+            <linearGradient id="grad-{slot}-{movie_id}" x1="0%" y1="0%" x2="100%" y2="100%">
                 <stop offset="0%" style="stop-color:{color1};stop-opacity:1" />
                 <stop offset="100%" style="stop-color:{color2};stop-opacity:1" />
             </linearGradient>
-            <filter id="shadow{movie_id}" x="-20%" y="-20%" width="140%" height="140%">
+            <filter id="shadow-{slot}-{movie_id}" x="-20%" y="-20%" width="140%" height="140%">
                 <feDropShadow dx="2" dy="2" stdDeviation="3" flood-color="rgba(0,0,0,0.3)"/>
             </filter>
         </defs>
-        <rect width="200" height="300" fill="url(#grad{movie_id})" rx="15" ry="15"/>
-        <circle cx="100" cy="120" r="25" fill="rgba(255,255,255,0.2)" filter="url(#shadow{movie_id})"/>
-        <text x="100" y="130" font-family="Arial, sans-serif" font-size="20" fill="white" text-anchor="middle" filter="url(#shadow{movie_id})">🎬</text>
-        <text x="100" y="180" font-family="Arial, sans-serif" font-size="12" font-weight="bold" fill="white" text-anchor="middle" filter="url(#shadow{movie_id})">{display_title}</text>
+        <rect width="200" height="300" fill="url(#grad-{slot}-{movie_id})" rx="15" ry="15"/>
+        <circle cx="100" cy="120" r="25" fill="rgba(255,255,255,0.2)" filter="url(#shadow-{slot}-{movie_id})"/>
+        <text x="100" y="130" font-family="Arial, sans-serif" font-size="20" fill="white" text-anchor="middle" filter="url(#shadow-{slot}-{movie_id})">🎬</text>
+        <text x="100" y="180" font-family="Arial, sans-serif" font-size="12" font-weight="bold" fill="white" text-anchor="middle" filter="url(#shadow-{slot}-{movie_id})">{display_title}</text>
         <text x="100" y="200" font-family="Arial, sans-serif" font-size="10" fill="rgba(255,255,255,0.8)" text-anchor="middle">ID: {movie_id}</text>
         <rect x="0" y="0" width="200" height="300" fill="none" stroke="rgba(255,255,255,0.3)" stroke-width="1" rx="15" ry="15"/>
     </svg>
     '''
     
-    encoded = base64.b64encode(svg.encode()).decode()
-    return f"data:image/svg+xml;base64,{encoded}"
+    # Returned as raw markup (no blank lines) so it can be inlined via st.markdown
+    return svg.strip()
 
 def main():
     """Enhanced main application function with modern UI"""
@@ -241,42 +239,47 @@ def main():
     """, unsafe_allow_html=True)
     
     # Load data with proper error handling
-    movies, cosine_sim, data_loaded = load_movie_data()
+    movies, tfidf, data_loaded = load_movie_data()
     
     if not data_loaded or movies is None:
-        st.error("❌ Cannot load movie data. Please check if 'movie_data.pkl' exists.")
+        st.error(f"❌ Cannot load movie data. Please check if '{MOVIES_FILE}' and '{TFIDF_FILE}' exist.")
         st.info("💡 Make sure you're running this from the correct directory.")
         
         # Provide more helpful information
         with st.expander("🔧 Troubleshooting", expanded=True):
             st.markdown("""
             **Common issues:**
-            1. **File not found**: Ensure `movie_data.pkl` is in the same directory as this app
-            2. **Corrupted file**: Try regenerating the pickle file from the original data
+            1. **File not found**: Run `python migrate_data.py` to convert `movie_data.pkl` into `movies.parquet` and `tfidf.npz`
+            2. **Corrupted file**: Try regenerating the pickle file from the original data, then re-run the migration
             3. **Permissions**: Check if you have read permissions for the file
             
             **Expected file structure:**
             ```
             movie-zone/
             ├── app.py
-            ├── movie_data.pkl
+            ├── movies.parquet
+            ├── tfidf.npz
+            ├── styles.css
             └── (other files)
             ```
             """)
         return
     
+    title_to_idx = build_index(movies)
+    titles_lower = build_search_titles(movies)
+    prefix_index = build_prefix_index(titles_lower)
+    stats = dataset_stats(movies)
+    
     # Enhanced sidebar with statistics
     with st.sidebar:
         st.markdown("### 📊 Dataset Statistics")
         
         # Create metrics in sidebar
-        total_movies = len(movies)
-        st.metric("🎬 Total Movies", f"{total_movies:,}")
+        st.metric("🎬 Total Movies", f"{stats['total']:,}")
         
         # Additional stats if columns are available
-        if 'genres' in movies.columns:
-            unique_genres = len(movies['genres'].dropna().unique()) if 'genres' in movies.columns else 0
-            st.metric("🎭 Unique Genres", unique_genres)
+        if stats['genres'] is not None:
+            st.metric("🎭 Unique Genres", stats['genres'])
         
         st.markdown("---")
         st.markdown("### 🚀 How CineMatch Works")
@@ -308,26 +311,43 @@ def main():
         search_term = st.text_input(
             "🔍 Search for a movie",
             placeholder="Type to search...",
-            help="Start typing to filter movies"
+            help="Start typing to filter movies by title prefix; start with * to match anywhere in the title"
         )
         
+        # Last real title the user picked, kept apart from the widget value so
+        # searches that don't include it (or find nothing) can't overwrite it
+        last_pick = st.session_state.get('last_pick')
+        default_index = 0
+        
         # Filter movies based on search
         if search_term:
-            filtered_movies = movies[movies['title'].str.contains(search_term, case=False, na=False)]
-            if not filtered_movies.empty:
-                movie_options = filtered_movies['title'].tolist()
+            matches = find_matching_rows(search_term, titles_lower, prefix_index)
+            if matches.size:
+                movie_options = movies['title'].to_numpy()[matches[:MAX_SEARCH_RESULTS]].tolist()
+                # Leave the box empty rather than silently switching movies
+                default_index = None
             else:
                 movie_options = ["No movies found matching your search"]
                 st.warning(f"No movies found matching '{search_term}'")
         else:
-            movie_options = movies['title'].tolist()
+            movie_options = movies['title'].head(DEFAULT_OPTIONS_COUNT).tolist()
+            # Keep the last pick selectable once the search is cleared
+            if last_pick in title_to_idx and last_pick not in movie_options:
+                movie_options.insert(0, last_pick)
+        
+        if last_pick in movie_options:
+            default_index = movie_options.index(last_pick)
         
         selected_movie = st.selectbox(
-            "Or choose from the complete list:",
+            "Or choose from the list:",
             movie_options,
-            index=0,
-            help="Select a movie to get personalized recommendations"
+            index=default_index,
+            key='movie_pick',
+            placeholder="Choose a movie from the search results",
+            help=f"Select a movie to get personalized recommendations (first {DEFAULT_OPTIONS_COUNT} shown, type above to search all)"
         )
+        if selected_movie in title_to_idx:
+            st.session_state['last_pick'] = selected_movie
     
     with col2:
         st.markdown("<br><br>", unsafe_allow_html=True)  # Spacing
@@ -340,88 +360,78 @@ def main():
     
     # Show selected movie info with enhanced display
     if selected_movie and selected_movie != "No movies found matching your search":
-        matching_movies = movies[movies['title'] == selected_movie]
-        if not matching_movies.empty:
-            selected_data = matching_movies.iloc[0]
+        selected_idx = title_to_idx.get(selected_movie)
+        if selected_idx is not None:
+            selected_data = movies.iloc[selected_idx]
             
             with st.expander(f"ℹ️ About '{selected_movie}'", expanded=False):
                 col1, col2 = st.columns([1, 3])
                 with col1:
-                    poster = create_enhanced_poster(selected_data['movie_id'], selected_movie)
-                    st.markdown('<div class="poster-container">', unsafe_allow_html=True)
-                    st.image(poster, width=150)
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    poster = create_enhanced_poster(int(selected_data['movie_id']), selected_movie, 'about')
+                    st.markdown(f'<div class="poster-container" style="max-width: 150px;">{poster}</div>', unsafe_allow_html=True)
                     
                 with col2:
                     st.markdown(f"**🆔 Movie ID:** {selected_data['movie_id']}")
                     
-                    if 'overview' in selected_data and pd.notna(selected_data['overview']):
+                    if 'overview' in selected_data and selected_data['overview']:
                         st.markdown(f"**📝 Overview:** {selected_data['overview']}")
                     else:
                         st.markdown("**📝 Overview:** No description available")
                     
-                    if 'genres' in selected_data and pd.notna(selected_data['genres']):
+                    if 'genres' in selected_data and selected_data['genres']:
                         st.markdown(f"**🎭 Genres:** {selected_data['genres']}")
     
-    # Enhanced recommendations display
+    # Recompute only when the button is clicked for a movie we have no results for
     if get_recs and selected_movie and selected_movie != "No movies found matching your search":
+        if st.session_state.get('recs_for') != selected_movie or not st.session_state.get('recs'):
+            with st.spinner("🧠 Finding similar movies..."):
+                recommendations = get_recommendations(selected_movie, movies, tfidf, title_to_idx)
+            
+            # Convert rows to tuples and build all posters up front
+            rows = list(recommendations.itertuples(index=False))
+            st.session_state['recs_for'] = selected_movie
+            st.session_state['recs'] = rows
+            st.session_state['rec_posters'] = [create_enhanced_poster(int(row.movie_id), row.title, 'grid') for row in rows]
+    
+    # Enhanced recommendations display, kept across reruns via session state
+    recs_for = st.session_state.get('recs_for')
+    if recs_for is not None:
+        rows = st.session_state['recs']
+        posters = st.session_state['rec_posters']
         st.markdown("---")
         
-        # Progress indicator
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        status_text.text("🔍 Analyzing movie preferences...")
-        progress_bar.progress(25)
-        time.sleep(0.1)
-        
-        status_text.text("🧠 Computing similarity scores...")
-        progress_bar.progress(50)
-        
-        recommendations = get_recommendations(selected_movie, movies, cosine_sim)
-        progress_bar.progress(75)
-        
-        status_text.text("✨ Preparing recommendations...")
-        progress_bar.progress(100)
-        time.sleep(0.1)
-        
-        # Clear progress indicators
-        progress_bar.empty()
-        status_text.empty()
-        
-        if recommendations.empty:
+        if not rows:
             st.error("❌ Could not generate recommendations. Please try another movie.")
         else:
-            st.success(f"🎯 **Top 10 movies similar to '{selected_movie}'**")
+            st.success(f"🎯 **Top 10 movies similar to '{recs_for}'**")
             
             # Enhanced grid display
-            for i in range(0, len(recommendations), 5):
+            for i in range(0, len(rows), 5):
                 cols = st.columns(5)
                 
                 for j in range(5):
-                    if i + j < len(recommendations):
-                        movie = recommendations.iloc[i + j]
+                    if i + j < len(rows):
+                        movie = rows[i + j]
                         
                         with cols[j]:
                             st.markdown('<div class="movie-card">', unsafe_allow_html=True)
                             
                             # Enhanced poster
-                            poster = create_enhanced_poster(movie['movie_id'], movie['title'])
-                            st.markdown('<div class="poster-container">', unsafe_allow_html=True)
-                            st.image(poster, width="stretch")
-                            st.markdown('</div>', unsafe_allow_html=True)
+                            st.markdown(f'<div class="poster-container">{posters[i + j]}</div>', unsafe_allow_html=True)
                             
                             # Movie details
-                            st.markdown(f"**{movie['title']}**")
-                            st.caption(f"🆔 ID: {movie['movie_id']}")
+                            st.markdown(f"**{movie.title}**")
+                            st.caption(f"🆔 ID: {movie.movie_id}")
                             
                             # Additional info if available
-                            if 'overview' in movie and pd.notna(movie['overview']):
-                                overview = movie['overview'][:100] + "..." if len(str(movie['overview'])) > 100 else str(movie['overview'])
+                            overview = getattr(movie, 'overview', '')
+                            if overview:
+                                overview = overview[:100] + "..." if len(overview) > 100 else overview
                                 st.caption(f"📝 {overview}")
                             
-                            if 'genres' in movie and pd.notna(movie['genres']):
-                                st.caption(f"🎭 {movie['genres']}")
+                            genres = getattr(movie, 'genres', '')
+                            if genres:
+                                st.caption(f"🎭 {genres}")
                             
                             st.markdown('</div>', unsafe_allow_html=True)
             
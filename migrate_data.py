@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+One-time migration of movie_data.pkl into the files app.py loads:
+movies.parquet for the metadata table and tfidf.npz for the sparse
+TF-IDF vectors the app computes similarities from, in place of the
+N x N cosine matrix.
+
+The TF-IDF vectors are refit from the pickled tags, so before anything is
+written, sampled rows of their dot products are checked against the pickled
+cosine matrix (atol 1e-4). On any mismatch the script exits non-zero without
+writing files; a successful run means the app scores movies the same way the
+notebook's matrix did.
+"""
+import pickle
+import sys
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+SOURCE_FILE = 'movie_data.pkl'
+MOVIES_FILE = 'movies.parquet'
+TFIDF_FILE = 'tfidf.npz'
+
+# Rows compared against the pickled matrix, and the allowed difference
+SAMPLE_ROWS = 8
+TOLERANCE = 1e-4
+
+
+def verify_against_pickle(tfidf_matrix: sp.csr_matrix, cosine_sim: np.ndarray) -> bool:
+    """Check that refit TF-IDF dot products match sampled rows of cosine_sim"""
+    n = tfidf_matrix.shape[0]
+    if cosine_sim.shape != (n, n):
+        print(f"❌ Pickled cosine matrix has shape {cosine_sim.shape}, expected {(n, n)}.")
+        return False
+
+    rng = np.random.default_rng(0)
+    rows = {0, n - 1, n // 2, *rng.integers(0, n, size=SAMPLE_ROWS).tolist()}
+    for i in sorted(rows):
+        recomputed = (tfidf_matrix[i] @ tfidf_matrix.T).toarray().ravel()
+        if not np.allclose(recomputed, cosine_sim[i], atol=TOLERANCE):
+            print(f"❌ Row {i} differs from the pickled cosine matrix; the TF-IDF settings don't match.")
+            return False
+    return True
+
+
+def main() -> int:
+    """Rebuild the TF-IDF vectors behind the pickled matrix and save both files"""
+    try:
+        with open(SOURCE_FILE, 'rb') as f:
+            movies, cosine_sim = pickle.load(f)
+    except FileNotFoundError:
+        print(f"❌ '{SOURCE_FILE}' not found. Generate it with the notebook first.")
+        return 1
+
+    if 'tags' not in movies.columns:
+        print(f"❌ '{SOURCE_FILE}' has no 'tags' column to build TF-IDF vectors from.")
+        return 1
+
+    # Same vectorizer as the notebook; its rows are L2-normalized, so a dot
+    # product between two rows equals the cosine similarity it stored
+    tfidf = TfidfVectorizer(stop_words='english', dtype=np.float32)
+    tfidf_matrix = sp.csr_matrix(tfidf.fit_transform(movies['tags']))
+    if not verify_against_pickle(tfidf_matrix, np.asarray(cosine_sim)):
+        return 1
+
+    sp.save_npz(TFIDF_FILE, tfidf_matrix)
+    movies.reset_index(drop=True).to_parquet(MOVIES_FILE)
+
+    print(f"✅ Wrote {MOVIES_FILE} ({len(movies):,} movies) and {TFIDF_FILE} {tfidf_matrix.shape}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())